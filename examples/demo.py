@@ -84,6 +84,51 @@ def main() -> None:
     print("  ... (iterator can be continued)")
     print()
 
+    # Columnar export: one typed buffer per output column
+    print("7. Columnar: SELECT salary, id, name FROM employees")
+    batch = engine.execute_columnar("SELECT salary, id, name FROM employees")
+    for name, col in zip(batch.schema.column_names(), batch.columns):
+        print("  ", name, col)
+    try:
+        import numpy as np
+
+        salaries = np.frombuffer(batch.column("salary"), dtype=np.float64)
+        print("   numpy view (zero-copy):", salaries)
+    except ImportError:
+        view = batch.buffer("salary")
+        print("   memoryview (zero-copy):", view.format, view.tolist())
+    try:
+        batch.buffer("name")
+    except TypeError as e:
+        print("   buffer('name') ->", e)
+    print()
+
+    print("8. Columnar with index: SELECT id, name FROM employees WHERE id = 3")
+    batch = engine.execute_columnar("SELECT id, name FROM employees WHERE id = 3")
+    print("  ", batch.columns)
+    batch = engine.execute_columnar("SELECT * FROM employees WHERE id = 99")
+    print("   no match ->", len(batch), "rows")
+    print()
+
+    print("9. Columnar batches of 3 rows (6 rows total):")
+    for batch in engine.execute_columnar_iter("SELECT id FROM employees", chunk_size=3):
+        print("  ", len(batch), "rows:", batch.column("id"))
+    try:
+        engine.execute_columnar_iter("SELECT id FROM employees", chunk_size=0)
+    except ValueError as e:
+        print("   chunk_size=0 ->", e)
+    print()
+
+    print("10. Columnar rejects values that do not fit the column type:")
+    bad = Table("bad", Schema(columns=[Column("score", DataType.INTEGER)]))
+    bad.insert_many([[1], [None]])
+    engine.register_table(bad)
+    try:
+        engine.execute_columnar("SELECT score FROM bad")
+    except ValueError as e:
+        print("  ", e)
+    print()
+
     print("Done.")
 
 
@@ -1,5 +1,6 @@
 from .engine import QueryEngine
 from .table import Table
 from .schema import Schema, Column, DataType
+from .columnar import ColumnBatch
 
-__all__ = ["QueryEngine", "Table", "Schema", "Column", "DataType"]
+__all__ = ["QueryEngine", "Table", "Schema", "Column", "DataType", "ColumnBatch"]
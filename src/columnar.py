@@ -0,0 +1,105 @@
+"""Columnar result export: one typed buffer per output column."""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Union
+
+from .schema import DataType, Schema
+
+# array typecodes per column type. STRING has no fixed-width encoding and is
+# kept as a plain list of Python objects.
+_TYPECODES = {
+    DataType.INTEGER: "q",
+    DataType.FLOAT: "d",
+    DataType.BOOLEAN: "b",
+}
+
+ColumnBuffer = Union[array, List[Any]]
+
+
+def _new_buffer(dtype: DataType) -> ColumnBuffer:
+    typecode = _TYPECODES.get(dtype)
+    return array(typecode) if typecode is not None else []
+
+
+@dataclass
+class ColumnBatch:
+    """Query result stored column-wise, in the order of the output schema.
+
+    Numeric and boolean columns are ``array.array`` buffers (int64, float64,
+    int8) and support the buffer protocol, so ``numpy.frombuffer`` wraps them
+    without copying. String columns are lists.
+
+    NULLs are not supported: a value that does not fit its column's buffer
+    (``None``, a float in an INTEGER column, an int outside the int64 range)
+    raises ValueError naming the column, its DataType and the value. The
+    failing row is not appended; rows appended before it are kept.
+    """
+
+    schema: Schema
+    columns: List[ColumnBuffer] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.columns = [_new_buffer(c.dtype) for c in self.schema.columns]
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def column(self, name: str) -> ColumnBuffer:
+        """Return the buffer for a column name. Raises KeyError if not found."""
+        return self.columns[self.schema.column_index(name)]
+
+    def buffer(self, name: str) -> memoryview:
+        """Return a zero-copy memoryview of a fixed-width column."""
+        col = self.column(name)
+        if not isinstance(col, array):
+            raise TypeError(f"Column {name!r} has no fixed-width buffer")
+        return memoryview(col)
+
+    def append_row(self, row: List[Any]) -> None:
+        """Append one row. Raises ValueError on length or type mismatch."""
+        if len(row) != len(self.columns):
+            raise ValueError(
+                f"Row length {len(row)} does not match schema {len(self.columns)}"
+            )
+        for i, (col, value) in enumerate(zip(self.columns, row)):
+            try:
+                col.append(value)
+            except (TypeError, OverflowError) as e:
+                for appended in self.columns[:i]:
+                    appended.pop()
+                column = self.schema.columns[i]
+                raise ValueError(
+                    f"Column {column.name!r} ({column.dtype.value}) "
+                    f"cannot store value {value!r}"
+                ) from e
+
+
+def to_batch(rows: Iterable[List[Any]], schema: Schema) -> ColumnBatch:
+    """Consume rows into a single ColumnBatch without materializing a row list."""
+    batch = ColumnBatch(schema)
+    for row in rows:
+        batch.append_row(row)
+    return batch
+
+
+def to_batches(
+    rows: Iterable[List[Any]], schema: Schema, chunk_size: int
+) -> Iterator[ColumnBatch]:
+    """Yield ColumnBatches of at most chunk_size rows (last batch may be shorter)."""
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    return _iter_batches(rows, schema, chunk_size)
+
+
+def _iter_batches(
+    rows: Iterable[List[Any]], schema: Schema, chunk_size: int
+) -> Iterator[ColumnBatch]:
+    batch = ColumnBatch(schema)
+    for row in rows:
+        batch.append_row(row)
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = ColumnBatch(schema)
+    if len(batch):
+        yield batch
@@ -1,7 +1,8 @@
 """Query engine: parse SQL-like queries, build execution plans, run them."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
+from .columnar import ColumnBatch, to_batch, to_batches
 from .parser import parse
 from .parser import ParseError
 from .planner import Planner
@@ -29,3 +30,17 @@ class QueryEngine:
         planner = Planner(self._tables)
         plan = planner.plan(ast)
         return iter(plan)
+
+    def execute_columnar(self, query: str) -> ColumnBatch:
+        """Execute query and return the result as one typed buffer per output column."""
+        ast = parse(query)
+        plan, schema = Planner(self._tables).plan_with_schema(ast)
+        return to_batch(plan, schema)
+
+    def execute_columnar_iter(
+        self, query: str, chunk_size: int = 65536
+    ) -> Iterator[ColumnBatch]:
+        """Execute query lazily, yielding ColumnBatches of at most chunk_size rows."""
+        ast = parse(query)
+        plan, schema = Planner(self._tables).plan_with_schema(ast)
+        return to_batches(plan, schema, chunk_size)
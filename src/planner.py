@@ -1,6 +1,7 @@
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 
 from .ast import SelectQuery
+from .schema import Schema
 from .table import Table
 from .operators import ScanOperator, FilterOperator, ProjectOperator, IndexScanOperator
 
@@ -15,6 +16,15 @@ class Planner:
         self, query: SelectQuery
     ) -> Union[ScanOperator, FilterOperator, ProjectOperator, IndexScanOperator]:
         """Build execution plan: (Index)Scan -> optional Filter -> optional Project."""
+        root, _ = self.plan_with_schema(query)
+        return root
+
+    def plan_with_schema(
+        self, query: SelectQuery
+    ) -> Tuple[
+        Union[ScanOperator, FilterOperator, ProjectOperator, IndexScanOperator], Schema
+    ]:
+        """Build execution plan and return it with the schema of its output rows."""
         if query.table_name not in self.tables:
             raise KeyError(f"Table not found: {query.table_name}")
         table = self.tables[query.table_name]
@@ -27,14 +37,13 @@ class Planner:
             root = FilterOperator(root, query.where, col_index)
 
         # Projection
+        indices = list(range(len(schema.columns)))
         if not query.select_all():
-            if query.columns == ["*"]:
-                indices = list(range(len(schema.columns)))
-            else:
+            if query.columns != ["*"]:
                 indices = [schema.column_index(c) for c in query.columns]
             root = ProjectOperator(root, indices)
 
-        return root
+        return root, Schema(columns=[schema.columns[i] for i in indices])
 
     def _build_scan(self, table: Table, query: SelectQuery):
         """Use IndexScan when WHERE is a single equality on an indexed column."""